@@ -26,6 +26,7 @@ class MarkerSpec(enum.Enum):
     integration = "Long duration tests"
     build = "FIXME for building stuff?"
     solver = "Tests that require a solver"
+    solve = "Tests that check the solve of a copy of a shared model"
     requires_idaes_solver = (
         "Tests that require a solver from the IDEAS extensions to pass"
     )
@@ -57,6 +58,17 @@ def _handle_requires_idaes_solver(
         action(f"This test is known to be failing with {solver_bin_path}")
 
 
+@pytest.fixture(scope="session")
+def solver():
+    """Default IDAES solver, or call pytest.skip if it is not available"""
+    from idaes.core.solvers import get_solver
+
+    solver = get_solver()
+    if not solver.available(exception_flag=False):
+        pytest.skip("Solver not available")
+    return solver
+
+
 def pytest_configure(config: Config):
 
     for marker_spec in MarkerSpec:
@@ -12,13 +12,14 @@
 """
 Tests for general zero-order property package
 """
+import re
+
 import pytest
 
 from types import MethodType
 from idaes.core import declare_process_block_class, FlowsheetBlock
 from idaes.core.util.model_statistics import degrees_of_freedom
-from idaes.core.solvers import get_solver
-from pyomo.environ import ConcreteModel, value
+from pyomo.environ import ConcreteModel
 from pyomo.network import Port
 from pyomo.util.check_units import assert_units_consistent
 
@@ -30,7 +31,15 @@ from watertap.core.zero_order_pt import (
     _get_Q_pt,
 )
 
-solver = get_solver()
+# Stream table rows in order; units and column spacing may vary between
+# IDAES versions, so only row labels and values are matched
+_PT_REPORT_RE = re.compile(
+    r"Volumetric Flowrate\s.*?\s1\.0600\s+1\.0600\s+"
+    r"Mass Concentration H2O\s.*?\s943\.40\s+943\.40\s+"
+    r"Mass Concentration A\s.*?\s9\.4340\s+9\.4340\s+"
+    r"Mass Concentration B\s.*?\s18\.868\s+18\.868\s+"
+    r"Mass Concentration C\s.*?\s28\.302\s+28\.302"
+)
 
 
 @declare_process_block_class("DerivedPT")
@@ -42,8 +51,8 @@ class DerivedPTData(ZeroOrderBaseData):
 
 
 class TestPT:
-    @pytest.fixture(scope="module")
-    def model(self):
+    @pytest.fixture(scope="session")
+    def structure_only_model(self):
         m = ConcreteModel()
 
         m.fs = FlowsheetBlock(dynamic=False)
@@ -52,6 +61,12 @@ class TestPT:
 
         m.fs.unit = DerivedPT(property_package=m.fs.water_props)
 
+        return m
+
+    @pytest.fixture(scope="session")
+    def model(self, structure_only_model):
+        m = structure_only_model.clone()
+
         m.fs.unit.inlet.flow_mass_comp[0, "H2O"].fix(1000)
         m.fs.unit.inlet.flow_mass_comp[0, "A"].fix(10)
         m.fs.unit.inlet.flow_mass_comp[0, "B"].fix(20)
@@ -60,7 +75,8 @@ class TestPT:
         return m
 
     @pytest.mark.unit
-    def test_private_attributes(self, model):
+    def test_private_attributes(self, structure_only_model):
+        model = structure_only_model
         assert model.fs.unit._tech_type is None
         assert model.fs.unit._has_recovery_removal is False
         assert model.fs.unit._fixed_perf_vars == []
@@ -76,7 +92,8 @@ class TestPT:
         assert model.fs.unit._perf_var_dict == {}
 
     @pytest.mark.unit
-    def test_build(self, model):
+    def test_build(self, structure_only_model):
+        model = structure_only_model
         assert isinstance(model.fs.unit.properties, WaterStateBlock)
 
         assert isinstance(model.fs.unit.inlet, Port)
@@ -94,11 +111,14 @@ class TestPT:
 
     @pytest.mark.component
     def test_solution(self, model):
-        for (t, j), v in model.fs.unit.outlet.flow_mass_comp.items():
-            assert pytest.approx(
-                value(model.fs.unit.inlet.flow_mass_comp[t, j]), rel=1e-5
-            ) == value(v)
+        # Inlet and outlet share a state block, so values match exactly
+        ins = [v.value for v in model.fs.unit.inlet.flow_mass_comp.values()]
+        outs = [v.value for v in model.fs.unit.outlet.flow_mass_comp.values()]
+        assert ins == outs
 
     @pytest.mark.component
-    def test_report(self, model):
+    def test_report(self, model, capsys):
         model.fs.unit.report()
+
+        captured = capsys.readouterr()
+        assert _PT_REPORT_RE.search(captured.out)